@@ -2,8 +2,9 @@ import customtkinter as ctk
 # import datetime # No longer needed here if dummy services are removed
 from ui.chat_window import ChatWindow
 from services.chat_service import ChatService
-from services.image_generator_service import ImageGeneratorService # To be implemented
-from services.storage_service import StorageService # To be implemented
+from services.image_generator_service import ImageGeneratorService # Import-light: torch/diffusers load lazily
+from services.storage_service import StorageService
+from services.session_service import SessionService
 
 # Dummy services for now, to be replaced by actual implementations from Phase 1
 # class DummyImageGeneratorService: # Remove this class
@@ -36,9 +37,14 @@ class MainApplication:
         ctk.set_appearance_mode("dark")  # Modes: "System" (default), "Dark", "Light"
         ctk.set_default_color_theme("blue")  # Themes: "blue" (default), "green", "dark-blue"
 
+        # Draw the window before anything heavy happens. The generator service is cheap
+        # to construct; its models are loaded in the background by ChatService.warm_up().
+        self.chat_window = ChatWindow(chat_service=None) # Pass None initially
+
         # Initialize services (using actual services now)
         self.image_generator_service = ImageGeneratorService()
         self.storage_service = StorageService() # Assuming storage_folder default is "storage" at project root
+        self.session_service = SessionService() # Conversation log at storage/session.jsonl
         
         # ChatWindow needs a reference to ChatService, but ChatService also needs a reference to ChatWindow (ui_view).
         # We'll pass a reference of ChatWindow to ChatService after ChatWindow is initialized.
@@ -48,11 +54,11 @@ class MainApplication:
         # 2. Create ChatService instance, passing the ChatWindow instance as ui_view.
         # 3. Set the chat_service attribute in ChatWindow.
 
-        self.chat_window = ChatWindow(chat_service=None) # Pass None initially
         self.chat_service = ChatService(
             image_generator_service=self.image_generator_service,
             storage_service=self.storage_service,
-            ui_view=self.chat_window # Pass the chat_window instance here
+            ui_view=self.chat_window, # Pass the chat_window instance here
+            session_service=self.session_service
         )
         self.chat_window.chat_service = self.chat_service # Now set the chat_service in ChatWindow
 
@@ -62,6 +68,9 @@ class MainApplication:
         # Let's refine ChatWindow's _on_send_prompt and _on_upload_image.
 
     def run(self):
+        # Replay the recent conversation and start loading the model once the window has been drawn.
+        self.chat_window.after_first_map(self.chat_service.restore_session)
+        self.chat_window.after_first_map(self.chat_service.warm_up)
         self.chat_window.mainloop()
 
 if __name__ == "__main__":
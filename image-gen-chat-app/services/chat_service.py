@@ -1,13 +1,90 @@
+import os
 import threading # Add threading import
+from datetime import datetime
 
 # Placeholder for ChatService
 class ChatService:
-    def __init__(self, image_generator_service, storage_service, ui_view):
+    HISTORY_PAGE_SIZE = 50 # Session records loaded at startup and per scroll-up
+
+    def __init__(self, image_generator_service, storage_service, ui_view, session_service=None):
         self.image_generator_service = image_generator_service
         self.storage_service = storage_service
         self.ui_view = ui_view  # To interact with the ChatWindow instance
+        self.session_service = session_service # Optional; when set, the conversation is persisted and replayed
         # self.uploaded_image_path = None # No longer needed here, passed directly to handle_user_prompt
 
+    def _load_models_in_background(self):
+        """Loads the generator's models off the UI thread and reports the outcome."""
+        if self.image_generator_service.load_models():
+            message = "Model loaded. Ready to generate."
+        else:
+            message = "Error loading the image model. Check the console for details."
+        if self.ui_view:
+            self.ui_view.after(0, lambda msg=message: self.ui_view.add_message_to_display(sender="System", message=msg))
+
+    def warm_up(self):
+        """Starts loading the image model in a background thread so the window can show immediately."""
+        if self.image_generator_service.is_loaded:
+            return
+
+        if self.ui_view:
+            self.ui_view.add_message_to_display(sender="System", message="Loading image model in the background...", is_loading=True)
+
+        warm_up_thread = threading.Thread(target=self._load_models_in_background, daemon=True)
+        warm_up_thread.start()
+
+    def _record_to_message(self, record: dict) -> dict | None:
+        """Converts a session log record into add_message_to_display() arguments."""
+        try:
+            timestamp = datetime.fromisoformat(record["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        except (KeyError, ValueError):
+            timestamp = None
+
+        if record.get("type") == "prompt":
+            prompt = (record.get("prompt") or "").strip()
+            if not prompt: # Image-only prompts are not shown as a message live either
+                return None
+            return {"sender": "You", "message": prompt, "timestamp": timestamp}
+
+        if record.get("type") == "result":
+            image_path = record.get("image_path")
+            if image_path:
+                thumbnail_path = self.storage_service.get_thumbnail_path(image_path)
+                if thumbnail_path:
+                    return {"sender": "Bot", "image_path": thumbnail_path, "timestamp": timestamp}
+                # No cached thumbnail: show a placeholder rather than decoding the full image on the UI thread.
+                if os.path.exists(image_path):
+                    return {"sender": "Bot", "message": f"Image saved at {image_path} (no preview available)", "timestamp": timestamp}
+                return {"sender": "Bot", "message": f"Image no longer available: {image_path}", "timestamp": timestamp}
+            return {"sender": "Bot", "message": record.get("message") or "", "timestamp": timestamp}
+
+        return None
+
+    def _records_to_messages(self, records: list[dict]) -> list[dict]:
+        messages = [self._record_to_message(record) for record in records]
+        return [message for message in messages if message]
+
+    def restore_session(self):
+        """Shows the most recent messages of the saved session; older ones are loaded on scroll-up."""
+        if not self.session_service or not self.ui_view:
+            return
+        records = self.session_service.load_recent(self.HISTORY_PAGE_SIZE)
+        self.ui_view.prepend_messages(self._records_to_messages(records))
+        if self.session_service.has_older_records:
+            self.ui_view.enable_history_paging()
+
+    def load_older_messages(self) -> bool:
+        """Adds the next page of older messages to the UI. Returns True if even older ones remain."""
+        if not self.session_service or not self.ui_view:
+            return False
+        records = self.session_service.load_older(self.HISTORY_PAGE_SIZE)
+        self.ui_view.prepend_messages(self._records_to_messages(records))
+        return self.session_service.has_older_records
+
+    def _log_result(self, image_path: str = None, message: str = None):
+        if self.session_service:
+            self.session_service.log_result(image_path=image_path, message=message)
+
     def _process_generation(self, text_prompt: str = None, uploaded_image_path: str = None):
         """Handles the actual image generation and storage in a separate thread."""
         generated_image_path_or_msg = None
@@ -16,6 +93,8 @@ class ChatService:
                 generated_image_pil = self.image_generator_service.generate_text_to_image(prompt=text_prompt)
                 if generated_image_pil:
                     generated_image_path_or_msg = self.storage_service.save_image(generated_image_pil, prompt_text=text_prompt)
+                    if not generated_image_path_or_msg:
+                        generated_image_path_or_msg = "Image was generated but saving it failed."
                 else:
                     generated_image_path_or_msg = "Text-to-image generation failed."
 
@@ -27,6 +106,7 @@ class ChatService:
                         initial_pil_image = Image.open(uploaded_image_path).convert("RGB")
                     except Exception as e:
                         generated_image_path_or_msg = f"Failed to load initial image: {uploaded_image_path}. Error: {e}"
+                        self._log_result(message=generated_image_path_or_msg)
                         # Schedule UI update for this error
                         if self.ui_view:
                             self.ui_view.after(0, lambda: self.ui_view.add_message_to_display(sender="Bot", message=generated_image_path_or_msg))
@@ -45,6 +125,8 @@ class ChatService:
                             prompt_text=text_prompt, 
                             original_filename=original_filename
                         )
+                        if not generated_image_path_or_msg:
+                            generated_image_path_or_msg = "Image was generated but saving it failed."
                     else:
                         generated_image_path_or_msg = "Image-to-image generation failed."
                 # else: # This case is now handled by the initial_pil_image check above
@@ -59,13 +141,16 @@ class ChatService:
             # Schedule the final UI update from the main thread
             if self.ui_view and generated_image_path_or_msg:
                 if "failed" in generated_image_path_or_msg.lower() or "please provide" in generated_image_path_or_msg.lower() or "error" in generated_image_path_or_msg.lower():
+                    self._log_result(message=generated_image_path_or_msg)
                     self.ui_view.after(0, lambda msg=generated_image_path_or_msg: self.ui_view.add_message_to_display(sender="Bot", message=msg))
                 else:
+                    self._log_result(image_path=generated_image_path_or_msg)
                     self.ui_view.after(0, lambda path=generated_image_path_or_msg: self.ui_view.add_message_to_display(sender="Bot", image_path=path))
 
         except Exception as e:
             error_message = f"Error during generation process: {str(e)}"
             print(f"ChatService Error in _process_generation: {error_message}") # Log to console
+            self._log_result(message=error_message)
             if self.ui_view:
                 self.ui_view.after(0, lambda msg=error_message: self.ui_view.add_message_to_display(sender="Bot", message=msg))
 
@@ -82,6 +167,14 @@ class ChatService:
         #     self.ui_view.add_message_to_display(sender="You", message=f"(Image: {uploaded_image_path.split('/')[-1]})")
 
 
+        if self.session_service:
+            mode = "image-to-image" if uploaded_image_path else "text-to-image"
+            self.session_service.log_prompt(
+                prompt=text_prompt,
+                uploaded_image_path=uploaded_image_path,
+                parameters=self.image_generator_service.get_generation_parameters(mode)
+            )
+
         # Add a "generating..." message to UI immediately
         if self.ui_view:
             self.ui_view.add_message_to_display(sender="Bot", message="Generating, please wait...", is_loading=True)
@@ -1,42 +1,91 @@
-import torch
-from diffusers import AutoPipelineForText2Image, AutoPipelineForImage2Image
+import threading
 from PIL import Image
 
+MODEL_ID = "stabilityai/sd-turbo"
+TEXT_TO_IMAGE_STEPS = 1
+IMAGE_TO_IMAGE_STEPS = 2
+IMAGE_TO_IMAGE_STRENGTH = 0.5 # Must be between 0 and 1
+GUIDANCE_SCALE = 0.0
+
 class ImageGeneratorService:
     def __init__(self):
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        if self.device == "cpu":
-            print("Warning: CUDA not available, falling back to CPU. Image generation will be slower.")
-
+        # torch/diffusers are imported lazily in load_models() so that constructing this
+        # service (and importing this module) stays cheap and the UI can be drawn first.
+        self.device = None
         self.text_to_image_pipe = None
         self.image_to_image_pipe = None
-
-        try:
-            print("Loading text-to-image model...")
-            self.text_to_image_pipe = AutoPipelineForText2Image.from_pretrained(
-                "stabilityai/sd-turbo",
-                torch_dtype=torch.float16,
-                variant="fp16"
-            )
-            self.text_to_image_pipe.to(self.device)
-            print("Text-to-image model loaded successfully.")
-
-            print("Loading image-to-image model...")
-            self.image_to_image_pipe = AutoPipelineForImage2Image.from_pretrained(
-                "stabilityai/sd-turbo",
-                torch_dtype=torch.float16,
-                variant="fp16"
-            )
-            self.image_to_image_pipe.to(self.device)
-            print("Image-to-image model loaded successfully.")
-
-        except Exception as e:
-            print(f"Error loading models: {e}")
-            # Optionally, re-raise the exception or handle it as per application's needs
-            # For now, we'll let the service initialize with None pipes if loading fails.
-            # The methods using these pipes will need to check if they are None.
+        self._models_loaded = False
+        self._load_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._models_loaded
+
+    def load_models(self) -> bool:
+        """Imports the ML stack and loads both pipelines once. Safe to call from any thread.
+
+        Returns True if at least the text-to-image pipeline is available.
+        """
+        with self._load_lock:
+            if self._models_loaded:
+                return self.text_to_image_pipe is not None
+
+            try:
+                import torch
+                from diffusers import AutoPipelineForText2Image, AutoPipelineForImage2Image
+            except Exception as e:
+                print(f"Error importing ML libraries: {e}")
+                self._models_loaded = True
+                return False
+
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            if self.device == "cpu":
+                print("Warning: CUDA not available, falling back to CPU. Image generation will be slower.")
+
+            try:
+                print("Loading text-to-image model...")
+                self.text_to_image_pipe = AutoPipelineForText2Image.from_pretrained(
+                    MODEL_ID,
+                    torch_dtype=torch.float16,
+                    variant="fp16"
+                )
+                self.text_to_image_pipe.to(self.device)
+                print("Text-to-image model loaded successfully.")
+
+                print("Loading image-to-image model...")
+                self.image_to_image_pipe = AutoPipelineForImage2Image.from_pretrained(
+                    MODEL_ID,
+                    torch_dtype=torch.float16,
+                    variant="fp16"
+                )
+                self.image_to_image_pipe.to(self.device)
+                print("Image-to-image model loaded successfully.")
+
+            except Exception as e:
+                print(f"Error loading models: {e}")
+                # We let the service continue with None pipes if loading fails.
+                # The methods using these pipes check if they are None.
+
+            self._models_loaded = True
+            return self.text_to_image_pipe is not None
+
+    def get_generation_parameters(self, mode: str) -> dict:
+        """Returns the parameters used for the given mode ("text-to-image" or "image-to-image")."""
+        if mode == "image-to-image":
+            return {
+                "model": MODEL_ID,
+                "num_inference_steps": IMAGE_TO_IMAGE_STEPS,
+                "strength": IMAGE_TO_IMAGE_STRENGTH,
+                "guidance_scale": GUIDANCE_SCALE,
+            }
+        return {
+            "model": MODEL_ID,
+            "num_inference_steps": TEXT_TO_IMAGE_STEPS,
+            "guidance_scale": GUIDANCE_SCALE,
+        }
 
     def generate_text_to_image(self, prompt: str) -> Image.Image | None:
+        self.load_models()
         if not self.text_to_image_pipe:
             print("Error: Text-to-image pipeline not initialized.")
             return None
@@ -44,8 +93,8 @@ class ImageGeneratorService:
             print(f"Generating text-to-image for prompt: '{prompt[:50]}...'")
             image = self.text_to_image_pipe(
                 prompt=prompt,
-                num_inference_steps=1,
-                guidance_scale=0.0
+                num_inference_steps=TEXT_TO_IMAGE_STEPS,
+                guidance_scale=GUIDANCE_SCALE
             ).images[0]
             print("Text-to-image generation successful.")
             return image
@@ -54,6 +103,7 @@ class ImageGeneratorService:
             return None
 
     def generate_image_to_image(self, prompt: str, init_image: Image.Image) -> Image.Image | None:
+        self.load_models()
         if not self.image_to_image_pipe:
             print("Error: Image-to-image pipeline not initialized.")
             return None
@@ -64,8 +114,8 @@ class ImageGeneratorService:
 
             # Ensure num_inference_steps * strength >= 1
             # Example values:
-            num_inference_steps = 2
-            strength = 0.5 # Must be between 0 and 1
+            num_inference_steps = IMAGE_TO_IMAGE_STEPS
+            strength = IMAGE_TO_IMAGE_STRENGTH
 
             if not (0 <= strength <= 1):
                  print(f"Warning: Strength ({strength}) is outside the valid range [0, 1]. Clamping to 0.5.")
@@ -90,7 +140,7 @@ class ImageGeneratorService:
                 image=resized_init_image,
                 num_inference_steps=num_inference_steps,
                 strength=strength,
-                guidance_scale=0.0
+                guidance_scale=GUIDANCE_SCALE
             ).images[0]
             print("Image-to-image generation successful.")
             return image
@@ -108,6 +158,7 @@ if __name__ == '__main__':
 
     print("Attempting to initialize ImageGeneratorService...")
     generator = ImageGeneratorService()
+    generator.load_models()
 
     if generator.text_to_image_pipe and generator.image_to_image_pipe:
         print("Service initialized. Attempting generations...")
@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+class SessionService:
+    """Append-only JSONL log of the conversation (prompts, parameters and results).
+
+    Records are read backwards from the end of the file, so loading the most recent
+    page costs the same no matter how long the session is.
+    """
+
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, session_file=os.path.join("storage", "session.jsonl")):
+        self.session_file = session_file
+        self._write_lock = threading.Lock()
+        self._read_offset = 0 # Byte offset where the oldest record loaded so far starts
+        self._ends_with_newline_checked = False
+
+        try:
+            session_folder = os.path.dirname(self.session_file)
+            if session_folder:
+                os.makedirs(session_folder, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating session directory for '{self.session_file}': {e}")
+
+    @property
+    def has_older_records(self) -> bool:
+        return self._read_offset > 0
+
+    def _ensure_trailing_newline(self):
+        """Terminates a partial last line (e.g. left by a crash) so the next record starts on its own line."""
+        if not os.path.exists(self.session_file) or os.path.getsize(self.session_file) == 0:
+            return
+        with open(self.session_file, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _append(self, record: dict):
+        record["timestamp"] = datetime.now().isoformat(timespec="seconds")
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            with self._write_lock:
+                if not self._ends_with_newline_checked:
+                    self._ensure_trailing_newline()
+                    self._ends_with_newline_checked = True
+                with open(self.session_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except Exception as e:
+            print(f"Error writing to session log '{self.session_file}': {e}")
+
+    def log_prompt(self, prompt: str, uploaded_image_path: str = None, parameters: dict = None):
+        self._append({
+            "type": "prompt",
+            "prompt": prompt,
+            "uploaded_image_path": uploaded_image_path,
+            "parameters": parameters or {},
+        })
+
+    def log_result(self, image_path: str = None, message: str = None):
+        self._append({
+            "type": "result",
+            "image_path": image_path,
+            "message": message,
+        })
+
+    def _read_lines_before(self, end_offset: int, count: int) -> tuple[list[bytes], int]:
+        """Reads up to `count` non-empty lines ending at `end_offset`, newest first.
+
+        Returns the lines and the offset where the oldest returned line starts.
+        """
+        lines = []
+        buffer = b""
+        position = end_offset # File offset of buffer[0]
+        with open(self.session_file, "rb") as f:
+            while len(lines) < count:
+                newline_index = buffer.rfind(b"\n")
+                if newline_index == -1:
+                    if position == 0:
+                        if buffer.strip():
+                            lines.append(buffer)
+                        buffer = b""
+                        break
+                    read_size = min(self.READ_CHUNK_SIZE, position)
+                    position -= read_size
+                    f.seek(position)
+                    buffer = f.read(read_size) + buffer
+                    continue
+
+                line = buffer[newline_index + 1:]
+                buffer = buffer[:newline_index]
+                if line.strip():
+                    lines.append(line)
+        return lines, position + len(buffer)
+
+    def _load_before_offset(self, count: int) -> list[dict]:
+        try:
+            lines, self._read_offset = self._read_lines_before(self._read_offset, count)
+        except Exception as e:
+            print(f"Error reading session log '{self.session_file}': {e}")
+            self._read_offset = 0
+            return []
+
+        records = []
+        for line in reversed(lines): # Oldest first
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                print(f"Skipping malformed session log entry: {line[:80]!r}")
+        return records
+
+    def load_recent(self, count: int) -> list[dict]:
+        """Returns the last `count` records, oldest first, and resets paging to them."""
+        if not os.path.exists(self.session_file):
+            self._read_offset = 0
+            return []
+        self._read_offset = os.path.getsize(self.session_file)
+        return self._load_before_offset(count)
+
+    def load_older(self, count: int) -> list[dict]:
+        """Returns up to `count` records older than the ones already loaded, oldest first."""
+        if not self.has_older_records:
+            return []
+        return self._load_before_offset(count)
+
+if __name__ == '__main__':
+    # Example Usage: shows that loading the last page does not depend on session length.
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        for total_records in (50, 5000):
+            session_service = SessionService(session_file=os.path.join(temp_folder, f"session_{total_records}.jsonl"))
+            for i in range(total_records // 2):
+                session_service.log_prompt(f"prompt {i}", parameters={"num_inference_steps": 1})
+                session_service.log_result(image_path=f"storage/image_{i}.png")
+
+            start = time.perf_counter()
+            records = session_service.load_recent(50)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{total_records} records: loaded last {len(records)} in {elapsed_ms:.2f} ms")
+
+            older = session_service.load_older(50)
+            print(f"  next page: {len(older)} records, more available: {session_service.has_older_records}")
+
+    print("Example usage finished.")
@@ -4,8 +4,11 @@ from PIL import Image
 import re # For sanitizing filename
 
 class StorageService:
+    THUMBNAIL_MAX_WIDTH = 300 # Matches the display width used by ChatWindow
+
     def __init__(self, storage_folder="storage"):
         self.storage_folder = storage_folder
+        self.thumbnail_folder = os.path.join(self.storage_folder, "thumbnails")
         # Ensure the storage folder is relative to this file's directory or a known base path
         # For simplicity, assuming it's relative to where main.py is run and is just "storage"
         # If main.py is in project root, and this service is in services/,
@@ -23,6 +26,7 @@ class StorageService:
 
         try:
             os.makedirs(self.storage_folder, exist_ok=True)
+            os.makedirs(self.thumbnail_folder, exist_ok=True)
             print(f"Storage folder '{self.storage_folder}' ensured at CWD: {os.getcwd()}.")
         except OSError as e:
             print(f"Error creating storage directory '{self.storage_folder}': {e}")
@@ -61,6 +65,7 @@ class StorageService:
             
             image.save(filepath, "PNG")
             print(f"Image saved successfully to {filepath}")
+            self._save_thumbnail(image, filepath)
             return filepath
         except Exception as e:
             print(f"Error saving image to {self.storage_folder} (path: {filepath if 'filepath' in locals() else 'unknown'}): {e}")
@@ -80,6 +85,28 @@ class StorageService:
             print(f"Error loading image from {image_path}: {e}")
             return None
 
+    def _thumbnail_path_for(self, image_path: str) -> str:
+        return os.path.join(self.thumbnail_folder, os.path.basename(image_path))
+
+    def _save_thumbnail(self, image: Image.Image, image_path: str):
+        """Writes the display-sized copy used when replaying a session. Failures are only logged."""
+        try:
+            thumbnail = image.copy()
+            thumbnail.thumbnail((self.THUMBNAIL_MAX_WIDTH, image.height), Image.LANCZOS)
+            thumbnail.save(self._thumbnail_path_for(image_path), "PNG")
+        except Exception as e:
+            print(f"Error creating thumbnail for {image_path}: {e}")
+
+    def get_thumbnail_path(self, image_path: str) -> str | None:
+        """Returns the path of the cached thumbnail written by save_image(), or None if there is none.
+
+        Only checks the filesystem, so it is cheap enough to call from the UI thread.
+        """
+        thumbnail_path = self._thumbnail_path_for(image_path)
+        if os.path.exists(thumbnail_path):
+            return thumbnail_path
+        return None
+
 if __name__ == '__main__':
     # Example Usage (requires Pillow)
     print("Attempting to initialize StorageService...")
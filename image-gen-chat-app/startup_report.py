@@ -0,0 +1,76 @@
+"""Startup import report, based on `python -X importtime`.
+
+Run from the image-gen-chat-app folder:
+    python startup_report.py            # report for `import main`
+    python startup_report.py --eager    # same, plus the ML stack main.py used to import eagerly
+
+It imports the given module in a fresh interpreter, then prints the total import time,
+the slowest top-level imports, and whether any heavy ML modules were pulled in.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("torch", "diffusers", "transformers", "accelerate")
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def collect_import_times(statement: str) -> tuple[dict[str, int], set[str]]:
+    """Runs `statement` under -X importtime.
+
+    Returns ({top-level import: cumulative microseconds}, {every module imported}).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=APP_DIR,
+    )
+    if result.returncode != 0:
+        # importtime lines are also on stderr; show only the last lines, which hold the traceback.
+        print("\n".join(result.stderr.strip().splitlines()[-5:]))
+        sys.exit(result.returncode)
+
+    timings = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.add(name.strip())
+        # Nested imports are indented further; only top-level entries are counted so nothing is summed twice.
+        if not name[1:].startswith(" "):
+            timings[name.strip()] = int(cumulative)
+    return timings, imported
+
+
+def print_report(title: str, statement: str, top: int):
+    timings, imported = collect_import_times(statement)
+    total_ms = sum(timings.values()) / 1000
+    print(f"== {title} ==")
+    print(f"Total import time: {total_ms:.1f} ms across {len(timings)} top-level imports")
+    for name, cumulative in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {cumulative / 1000:>9.1f} ms  {name}")
+
+    heavy = [name for name in imported if name in HEAVY_MODULES]
+    if heavy:
+        print(f"Heavy ML modules imported: {', '.join(sorted(heavy))}")
+    else:
+        print("Heavy ML modules imported: none")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report how long `import main` takes.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list.")
+    parser.add_argument("--eager", action="store_true", help="Also time main plus the eager torch/diffusers imports, for comparison.")
+    args = parser.parse_args()
+
+    print_report("import main (lazy ML imports)", "import main", args.top)
+    if args.eager:
+        print_report("import main + torch + diffusers (previous eager path)", "import main, torch, diffusers", args.top)
+
+
+if __name__ == '__main__':
+    main()
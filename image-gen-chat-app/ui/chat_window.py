@@ -5,6 +5,9 @@ from PIL import Image, ImageTk # Import Pillow
 import os # For joining paths
 
 class ChatWindow(ctk.CTk):
+    HISTORY_POLL_INTERVAL_MS = 250
+    MIN_MESSAGE_WRAPLENGTH = 300
+
     def __init__(self, chat_service):
         super().__init__()
         self.title("AI Image Generator")
@@ -13,6 +16,9 @@ class ChatWindow(ctk.CTk):
         self.chat_service = chat_service # This will be set by MainApplication
         self.current_uploaded_image_path = None # To store path from file dialog before sending with prompt
         self.current_uploaded_image_thumbnail = None # To hold the CTkImage for the thumbnail
+        self.history_paging_enabled = False # Set by enable_history_paging() when older messages exist
+        self._is_mapped = False
+        self._on_first_map_callbacks = []
 
         # Main frame
         self.main_frame = ctk.CTkFrame(self)
@@ -107,9 +113,15 @@ class ChatWindow(ctk.CTk):
         else:
             self.current_uploaded_image_path = None # No need to explicitly clear if dialog is cancelled, already handled by _clear_uploaded_image_thumbnail on send
 
-    def add_message_to_display(self, sender: str, message: str = None, image_path: str = None, is_loading: bool = False):
-        """Adds a message or an image to the chat display using individual frames for better layout."""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+    def add_message_to_display(self, sender: str, message: str = None, image_path: str = None, is_loading: bool = False, timestamp: str = None, before=None):
+        """Adds a message or an image to the chat display using individual frames for better layout.
+
+        `timestamp` overrides the current time (used when replaying a session), and `before`
+        inserts the message above that message frame instead of appending it at the bottom.
+        Returns the message frame.
+        """
+        if timestamp is None:
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         
         # Determine alignment based on sender
         if sender.lower() == "you":
@@ -146,7 +158,7 @@ class ChatWindow(ctk.CTk):
         header_label.pack(padx=10, pady=(5,0), anchor="nw")
 
         if message:
-            msg_label = ctk.CTkLabel(content_frame, text=message, wraplength=self.chat_scrollable_frame.winfo_width() - 100, justify=ctk.LEFT if anchor == 'w' else ctk.RIGHT, text_color=text_color, font=("Segoe UI", 14))
+            msg_label = ctk.CTkLabel(content_frame, text=message, wraplength=self._message_wraplength(), justify=ctk.LEFT if anchor == 'w' else ctk.RIGHT, text_color=text_color, font=("Segoe UI", 14))
             msg_label.pack(padx=10, pady=(0,10), anchor="w")
 
         if image_path:
@@ -165,20 +177,92 @@ class ChatWindow(ctk.CTk):
                 img_label.pack(padx=10, pady=10, anchor="w")
             except Exception as e:
                 error_msg = f"Error displaying image {os.path.basename(image_path)}: {e}"
-                err_label = ctk.CTkLabel(content_frame, text=error_msg, text_color="red", wraplength=self.chat_scrollable_frame.winfo_width() - 100, justify=ctk.LEFT)
+                err_label = ctk.CTkLabel(content_frame, text=error_msg, text_color="red", wraplength=self._message_wraplength(), justify=ctk.LEFT)
                 err_label.pack(padx=10, pady=10, anchor="w")
         
         # Pack the content_frame within outer_message_frame
         content_frame.pack(padx=5, pady=2, anchor=anchor) # Anchor inside its parent for alignment
 
         # Pack the outer_message_frame to the chat_scrollable_frame, making it stick to one side or the other
+        pack_options = {"before": before} if before is not None else {}
         if anchor == 'e': # User message
-            outer_message_frame.pack(fill=ctk.X, padx=(50,5), pady=2) # Push to right
+            outer_message_frame.pack(fill=ctk.X, padx=(50,5), pady=2, **pack_options) # Push to right
         else: # Bot or System message
-            outer_message_frame.pack(fill=ctk.X, padx=(5,50), pady=2) # Push to left
-            
-        self.update_idletasks() # Important for scrollbar to know the new content size
-        self.chat_scrollable_frame._parent_canvas.yview_moveto(1.0) # Scroll to bottom
+            outer_message_frame.pack(fill=ctk.X, padx=(5,50), pady=2, **pack_options) # Push to left
+
+        if before is None:
+            self.update_idletasks() # Important for scrollbar to know the new content size
+            self.chat_scrollable_frame._parent_canvas.yview_moveto(1.0) # Scroll to bottom
+        return outer_message_frame
+
+    def prepend_messages(self, messages: list[dict]):
+        """Inserts older messages (oldest first) above the current ones, keeping the visible messages in place.
+
+        Each message is a dict of add_message_to_display() keyword arguments.
+        """
+        if not messages:
+            return
+
+        canvas = self.chat_scrollable_frame._parent_canvas
+        existing_frames = self.chat_scrollable_frame.pack_slaves()
+        if not existing_frames: # Nothing on screen yet, so this is the initial page
+            for message in messages:
+                self.add_message_to_display(**message)
+            return
+
+        self.update_idletasks()
+        old_height = self.chat_scrollable_frame.winfo_reqheight()
+        old_top = canvas.yview()[0]
+
+        first_frame = existing_frames[0]
+        for message in messages:
+            self.add_message_to_display(before=first_frame, **message)
+
+        self.update_idletasks()
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        new_height = self.chat_scrollable_frame.winfo_reqheight()
+        if new_height > 0:
+            canvas.yview_moveto((old_top * old_height + new_height - old_height) / new_height)
+
+    def _message_wraplength(self) -> int:
+        width = self.chat_scrollable_frame.winfo_width()
+        if width <= 1: # Not laid out yet (e.g. messages restored before the window is shown)
+            self.update_idletasks()
+            width = self.chat_scrollable_frame.winfo_width()
+        return max(width - 100, self.MIN_MESSAGE_WRAPLENGTH)
+
+    def after_first_map(self, callback):
+        """Runs `callback` once the window has been mapped, so widget sizes are real when it adds messages."""
+        if self._is_mapped:
+            self.after_idle(callback)
+            return
+        if not self._on_first_map_callbacks:
+            self.bind("<Map>", self._on_map, add="+")
+        self._on_first_map_callbacks.append(callback)
+
+    def _on_map(self, event):
+        # <Map> on the window is also delivered for its child widgets; only react to the window itself.
+        if event.widget is not self or self._is_mapped:
+            return
+        self._is_mapped = True
+        callbacks, self._on_first_map_callbacks = self._on_first_map_callbacks, []
+        for callback in callbacks:
+            self.after_idle(callback)
+
+    def enable_history_paging(self):
+        """Starts asking the chat service for older messages whenever the view is scrolled to the top."""
+        if not self.history_paging_enabled:
+            self.history_paging_enabled = True
+            self.after(self.HISTORY_POLL_INTERVAL_MS, self._poll_history_scroll)
+
+    def _poll_history_scroll(self):
+        if not self.history_paging_enabled:
+            return
+        if self.chat_service and self.chat_scrollable_frame._parent_canvas.yview()[0] <= 0.0:
+            # Also fills the view when the loaded messages are not tall enough to scroll yet.
+            self.history_paging_enabled = self.chat_service.load_older_messages()
+        if self.history_paging_enabled:
+            self.after(self.HISTORY_POLL_INTERVAL_MS, self._poll_history_scroll)
 
 # The __main__ part for independent testing needs to be updated to reflect ChatService dependency
 if __name__ == '__main__':